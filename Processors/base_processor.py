@@ -5,22 +5,40 @@ Contains common functionality for all node processors
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import threading
 from datetime import datetime
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
 
 
 class BaseProcessor(ABC):
     """Abstract base class for all node processors"""
 
     NOT_FOUND = 'not Found!'
+    # Lower-cased strings treated as a missing value
+    NOT_FOUND_VALUES = frozenset(['not found!', 'not found', 'nan', 'nat', 'none', ''])
 
     def __init__(self, status_callback=None):
         self.logs = []
         self.status_callback = status_callback
         self.node_name = "BASE"  # Override in child classes
+        self._local = threading.local()
 
     def log(self, message):
         """Add log message and update UI if callback exists"""
+        buffered = getattr(self._local, 'messages', None)
+        if buffered is not None:
+            # Inside run_concurrently - replayed on the calling thread once the step is done
+            buffered.append(message)
+            return
         self.logs.append(message)
         print(message)
         if self.status_callback:
@@ -36,28 +54,92 @@ class BaseProcessor(ABC):
 
     # ============== COMMON HELPER FUNCTIONS ==============
 
+    def read_input_files(self, files_dict, columns):
+        """Read the input Excel files concurrently - columns maps each file key to the columns to keep (None = all)"""
+        with ThreadPoolExecutor(max_workers=len(columns)) as executor:
+            futures = [
+                executor.submit(
+                    pd.read_excel, files_dict[key], sheet_name='Sheet1', engine=EXCEL_ENGINE,
+                    # Callable so optional columns that are absent from the file don't raise
+                    usecols=None if cols is None else cols.__contains__
+                )
+                for key, cols in columns.items()
+            ]
+            return [future.result() for future in futures]
+
+    def join_columns(self, columns, sep=','):
+        """Join columns element-wise as strings (e.g. parent,child,source keys) - the join runs in Arrow"""
+        arrays = [pa.array(col.astype(str).to_numpy(dtype=object), type=pa.string()) for col in columns]
+        joined = pc.binary_join_element_wise(*arrays, sep)
+        return pd.Series(joined.to_numpy(zero_copy_only=False), index=columns[0].index, dtype=object)
+
+    def run_concurrently(self, *steps):
+        """Run independent (function, argument) steps in worker threads and return their results in order.
+        Each step's log messages are replayed afterwards on the calling thread, step by step."""
+        def run(function, argument):
+            messages = self._local.messages = []
+            try:
+                return function(argument), messages, None
+            except Exception as e:
+                return None, messages, e
+            finally:
+                self._local.messages = None
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(run, function, argument) for function, argument in steps]
+            outcomes = [future.result() for future in futures]
+
+        results = []
+        for result, messages, error in outcomes:
+            for message in messages:
+                self.log(message)
+            if error is not None:
+                raise error
+            results.append(result)
+        return results
+
     def is_not_found(self, value):
         """Check if value is 'not Found!' or equivalent"""
-        if value is None:
-            return True
-        if pd.isna(value):
+        if value is None or value is pd.NaT:
             return True
         if isinstance(value, str):
-            val_lower = value.strip().lower()
-            if val_lower in ['not found!', 'not found', 'nan', 'nat', 'none', '']:
-                return True
-        return False
+            return value.strip().lower() in self.NOT_FOUND_VALUES
+        if isinstance(value, float):
+            return value != value
+        try:
+            return bool(pd.isna(value))
+        except (TypeError, ValueError):
+            return False
+
+    def is_not_found_series(self, series):
+        """Vectorized is_not_found - returns a boolean mask for the whole series"""
+        normalized = series.astype(str).str.strip().str.lower()
+        return series.isna() | normalized.isin(self.NOT_FOUND_VALUES)
 
     def safe_to_numeric(self, series):
         """Safely convert series to numeric, returning NaN for invalid values"""
-        def convert(x):
-            if self.is_not_found(x):
-                return np.nan
-            try:
-                return float(x)
-            except (ValueError, TypeError):
-                return np.nan
-        return series.apply(convert)
+        # 'not Found!' and other non-numeric strings are coerced to NaN
+        return pd.to_numeric(series, errors='coerce').astype(float)
+
+    def scores_to_strings(self, series):
+        """Vectorized str(int(x)) for looked-up scores - text is kept, missing becomes 'not Found!'"""
+        numeric = pd.to_numeric(series, errors='coerce')
+        # Only finite scores that fit in int64 are truncated - 'inf' or huge values keep their text
+        convertible = np.isfinite(numeric) & (numeric.abs() < 2 ** 63)
+        result = np.trunc(numeric.where(convertible)).astype('Int64').astype(str).where(convertible, series.astype(str))
+        return result.where(series.notna(), self.NOT_FOUND)
+
+    def risk_to_cadence(self, risk_scores):
+        """Initial cadence score per risk score from RISK_TO_CADENCE - scores outside it get 30"""
+        # Lookup array indexed by the risk score keys themselves, whatever their order
+        keys = np.array(list(self.RISK_TO_CADENCE), dtype=int)
+        lookup = np.full(keys.max() + 1, 30)
+        lookup[keys] = list(self.RISK_TO_CADENCE.values())
+
+        risk = risk_scores.to_numpy(dtype=float)
+        in_table = np.isin(risk, keys)
+        risk_index = np.where(in_table, risk, 0).astype(int)
+        return np.where(in_table, lookup[risk_index], 30)
 
     def to_string_safe(self, value):
         """Convert any value to string safely"""
@@ -89,6 +171,15 @@ class BaseProcessor(ABC):
         except Exception:
             return self.NOT_FOUND
 
+    def dates_to_strings(self, series):
+        """Vectorized date_to_string - convert a whole series of dates to strings"""
+        not_found = self.is_not_found_series(series)
+        # date_to_string keeps strings as they are - only the other values are parsed and formatted
+        is_str = series.apply(isinstance, args=(str,)).astype(bool)
+        parsed = pd.to_datetime(series.where(~is_str), errors='coerce').dt.strftime('%Y-%m-%d')
+        formatted = parsed.where(~is_str, series)
+        return formatted.where(~not_found & formatted.notna(), self.NOT_FOUND)
+
     def add_days_to_date(self, date_value, days):
         """Add days to a date and return as string"""
         if self.is_not_found(date_value):
@@ -117,8 +208,9 @@ class BaseProcessor(ABC):
 
     # ============== ABSTRACT METHODS (Must be implemented by child classes) ==============
 
+    @classmethod
     @abstractmethod
-    def get_required_files(self):
+    def get_required_files(cls):
         """Return list of required file descriptions for this processor"""
         pass
 
@@ -127,7 +219,8 @@ class BaseProcessor(ABC):
         """Main processing function - must be implemented by each processor"""
         pass
 
+    @classmethod
     @abstractmethod
-    def get_node_config(self):
+    def get_node_config(cls):
         """Return node-specific configuration"""
         pass
\ No newline at end of file
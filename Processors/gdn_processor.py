@@ -25,6 +25,16 @@ class GDNProcessor(BaseProcessor):
         5: 365
     }
 
+    # Only these columns are parsed from the input files
+    ARMT_COLUMNS = frozenset([
+        'child_class', 'parent_class', 'policy_name', 'program',
+        'source_country', 'include_destination_country', 'parent_score'
+    ])
+    OUTFLOW_COLUMNS = frozenset([
+        'root_cause', 'root_cause_details', 'assigned_to_group', 'short_description',
+        'resolved_date', 'resolution', 'quantity', 'vendor_id'
+    ])
+
     def __init__(self, status_callback=None):
         super().__init__(status_callback)
         self.node_name = "GDN"
@@ -37,7 +47,8 @@ class GDNProcessor(BaseProcessor):
             'SA', 'CA', 'NL', 'EG', 'MX', 'UK'
         ]
 
-    def get_required_files(self):
+    @classmethod
+    def get_required_files(cls):
         """Return list of required files for GDN processor"""
         return [
             {
@@ -60,7 +71,8 @@ class GDNProcessor(BaseProcessor):
             }
         ]
 
-    def get_node_config(self):
+    @classmethod
+    def get_node_config(cls):
         """Return GDN node configuration"""
         return {
             'name': 'GDN',
@@ -69,52 +81,50 @@ class GDNProcessor(BaseProcessor):
             'color': '#dc3545'
         }
 
+    def group_by_child_class(self, armt):
+        """Group ARMT rows by child_class - unique parent classes/policies are comma-joined"""
+        grouped = armt.groupby('child_class').agg({
+            'program': 'first',
+            'Source': 'first',
+            'Destination': 'first',
+            'parent_score': 'first'
+        })
+
+        for col in ['parent_class', 'policy_name']:
+            pairs = pd.DataFrame({'child_class': armt['child_class'], col: armt[col].astype(str)}).drop_duplicates()
+            grouped[col] = pairs.groupby('child_class')[col].agg(','.join)
+
+        return grouped.reset_index()[
+            ['child_class', 'parent_class', 'policy_name', 'program', 'Source', 'Destination', 'parent_score']
+        ]
+
     def process_armt(self, armt):
         """Process ARMT data for GDN - Groups by child_class"""
         self.log('📂 Processing ARMT data for GDN...')
 
-        cols_to_drop = [
-            'parent_job_status', 'parent_job_type', 'parent_last_updated_time',
-            'child_job_status', 'child_job_type', 'child_last_updated_time'
-        ]
-        armt = armt.drop(cols_to_drop, axis=1, errors='ignore')
-
         armt['Source'] = armt['source_country'].astype(str).str.strip()
         armt['Destination'] = armt['include_destination_country'].astype(str).str.strip()
+        armt['program'] = armt['program'].astype('category')
 
         # Handle No-Child cases - replace with parent_class
         self.log('   Handling No-Child cases...')
-        for i in range(len(armt)):
-            if armt.at[i, 'child_class'] == 'No-Child':
-                armt.at[i, 'child_class'] = armt.at[i, 'parent_class']
+        no_child = armt['child_class'].to_numpy() == 'No-Child'
+        armt['child_class'] = np.where(no_child, armt['parent_class'].to_numpy(), armt['child_class'].to_numpy())
 
         # Process AmazonGlobal - Group by child_class
         self.log('   Processing AmazonGlobal (grouped by child_class)...')
         armt_core = armt[armt['program'] == 'AmazonGlobal'].copy()
         if len(armt_core) > 0:
-            armt_core = armt_core.groupby(['child_class']).agg({
-                'parent_class': lambda x: ','.join(x.astype(str).unique()),
-                'policy_name': lambda x: ','.join(x.astype(str).unique()),
-                'program': 'first',
-                'Source': 'first',
-                'Destination': 'first',
-                'parent_score': 'first'
-            }).reset_index()
+            armt_core = self.group_by_child_class(armt_core)
 
         # Process CrossListing - Group by child_class
         self.log('   Processing CrossListing (grouped by child_class)...')
         armt_cross = armt[armt['program'] == 'CrossListing'].copy()
         if len(armt_cross) > 0:
-            armt_cross = armt_cross.groupby(['child_class']).agg({
-                'parent_class': lambda x: ','.join(x.astype(str).unique()),
-                'policy_name': lambda x: ','.join(x.astype(str).unique()),
-                'program': 'first',
-                'Source': 'first',
-                'Destination': 'first',
-                'parent_score': 'first'
-            }).reset_index()
+            armt_cross = self.group_by_child_class(armt_cross)
 
         armt = pd.concat([armt_core, armt_cross], ignore_index=True)
+        armt['program'] = armt['program'].astype(object)
 
         self.log(f'✅ ARMT processed: {len(armt):,} records (grouped by child_class)')
         return armt
@@ -126,6 +136,7 @@ class GDNProcessor(BaseProcessor):
         initial_count = len(outflow)
 
         outflow = outflow.dropna(subset=['root_cause', 'root_cause_details'])
+        outflow['root_cause'] = outflow['root_cause'].astype('category')
 
         # GDN specific groups to remove
         del_groups = [
@@ -133,6 +144,7 @@ class GDNProcessor(BaseProcessor):
             'RP - AG Auditors FR', 'RP - AG Auditors IT'
         ]
         if 'assigned_to_group' in outflow.columns:
+            outflow['assigned_to_group'] = outflow['assigned_to_group'].astype('category')
             outflow = outflow[~outflow['assigned_to_group'].isin(del_groups)]
 
         del_causes = ['Duplicate', 'Other', 'Negative Class']
@@ -142,19 +154,17 @@ class GDNProcessor(BaseProcessor):
         outflow['parent_class'] = outflow['root_cause_details'].astype(str).str.split('\\\\').str[0].str.strip()
 
         # Process dates
-        outflow['resolved_date'] = outflow['resolved_date'].astype(str)
-        outflow['Resolved date'] = outflow['resolved_date'].str.split(' ').str[0]
-        outflow['Resolved date'] = pd.to_datetime(outflow['Resolved date'], format='%Y-%m-%d', errors='coerce')
-        outflow['Resolved date'] = outflow['Resolved date'].apply(self.date_to_string)
+        resolved = outflow['resolved_date']
+        if not pd.api.types.is_datetime64_any_dtype(resolved):
+            resolved = pd.to_datetime(resolved.astype(str).str.split(' ').str[0], format='%Y-%m-%d', errors='coerce')
+        outflow['Resolved date'] = resolved.dt.strftime('%Y-%m-%d').fillna(self.NOT_FOUND)
         outflow = outflow.sort_values(by='Resolved date', ascending=False)
 
         outflow = outflow.reset_index(drop=True)
 
         # Process resolution
-        for i in range(len(outflow)):
-            outflow.at[i, 'resolution'] = str(outflow['resolution'].iloc[i]).split("\\")[0]
-            if outflow['child_class'].iloc[i] == outflow['parent_class'].iloc[i]:
-                outflow.at[i, 'child_class'] = 'No-Child'
+        outflow['resolution'] = outflow['resolution'].astype(str).str.split('\\', n=1).str[0]
+        outflow.loc[outflow['child_class'] == outflow['parent_class'], 'child_class'] = 'No-Child'
 
         outflow['source'] = outflow['resolution'].str.split('-').str[0]
         outflow['destination'] = outflow['resolution'].str.split('-').str[1]
@@ -164,7 +174,11 @@ class GDNProcessor(BaseProcessor):
         outflow['NC'] = outflow['quantity'] + outflow['vendor_id']
 
         # Group by child_class for GDN
-        outflow1 = outflow.groupby('child_class', as_index=False)['NC'].sum()
+        child_classes, codes = np.unique(outflow['child_class'].to_numpy(), return_inverse=True)
+        outflow1 = pd.DataFrame({
+            'child_class': child_classes,
+            'NC': np.bincount(codes, weights=outflow['NC'].to_numpy(dtype=float), minlength=len(child_classes))
+        })
 
         self.log(f'✅ Outflow processed: {len(outflow):,} records (from {initial_count:,})')
 
@@ -174,35 +188,31 @@ class GDNProcessor(BaseProcessor):
         """Create node mapping for GDN based on child_class"""
         self.log('🗺️ Creating GDN node mappings...')
 
-        nodes = set()
+        # Source/Destination are already stripped strings from process_armt - split each once
+        sources = armt['Source'].str.split(',').explode().str.strip()
+        destinations = armt['Destination'].str.split(',').explode().str.strip()
 
-        for i in range(len(armt)):
-            source = str(armt['Source'].iloc[i]).split(',')
-            destination = str(armt['Destination'].iloc[i]).split(',')
-            program = str(armt['program'].iloc[i])
-            child_class = armt['child_class'].iloc[i]
+        # AmazonGlobal - DE source
+        core_mask = sources.isin(self.GDN_Core).groupby(level=0).any()
 
-            # AmazonGlobal - DE source
-            for j in source:
-                if j.strip() in self.GDN_Core:
-                    nodes.add(child_class)
+        # CrossListing - destination in GDN_Cross and source not in excluded
+        cross_mask = (
+                (armt['program'] == 'CrossListing') &
+                destinations.isin(self.GDN_Cross).groupby(level=0).any() &
+                (~sources.isin(self.GDN_Excluded_Sources)).groupby(level=0).any()
+        )
 
-            # CrossListing - destination in GDN_Cross and source not in excluded
-            if program == 'CrossListing':
-                for k in destination:
-                    for t in source:
-                        if k.strip() in self.GDN_Cross and t.strip() not in self.GDN_Excluded_Sources:
-                            nodes.add(child_class)
+        nodes = pd.unique(armt.loc[core_mask | cross_mask, 'child_class']).tolist()
 
         self.log(f'✅ Created {len(nodes):,} unique GDN nodes (by child_class)')
-        return list(nodes)
+        return nodes
 
     def create_cadence(self, nodes, armt, outflow, outflow1):
         """Create cadence dataframe for GDN"""
         self.log('⚙️ Creating GDN Cadence dataframe...')
 
         # GDN uses 'child_class' as the main column
-        Cadence = pd.DataFrame({'child_class': nodes})
+        Cadence = pd.DataFrame({'child_class': nodes}).convert_dtypes(dtype_backend='pyarrow')
         total = len(Cadence)
         self.log(f'   Processing {total:,} records...')
 
@@ -210,37 +220,42 @@ class GDNProcessor(BaseProcessor):
 
         armt_lookup = armt.drop_duplicates(subset=['child_class']).set_index('child_class')
         outflow_lookup = outflow.drop_duplicates(subset=['child_class']).set_index('child_class')
-        nc_lookup = outflow1.set_index('child_class')['NC'].to_dict()
+        nc_lookup = outflow1.set_index('child_class')['NC']
 
         self.log('   Applying lookups...')
 
-        cc = Cadence['child_class']
+        # Lookups - all ARMT columns in a single join
+        armt_columns = armt_lookup[
+            ['program', 'policy_name', 'parent_class', 'Source', 'Destination', 'parent_score']
+        ].rename(columns={'policy_name': 'Policies', 'parent_class': 'Parent Classes', 'parent_score': 'risk score'})
+        Cadence = Cadence.join(armt_columns, on='child_class')
 
-        # Lookups
-        Cadence['program'] = cc.map(armt_lookup['program'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Policies'] = cc.map(armt_lookup['policy_name'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Parent Classes'] = cc.map(armt_lookup['parent_class'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Source'] = cc.map(armt_lookup['Source'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Destination'] = cc.map(armt_lookup['Destination'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['risk score'] = cc.map(armt_lookup['parent_score'].to_dict()).fillna(1)
+        str_cols = ['program', 'Policies', 'Parent Classes', 'Source', 'Destination']
+        Cadence[str_cols] = Cadence[str_cols].fillna(self.NOT_FOUND).astype(str)
+        Cadence['risk score'] = Cadence['risk score'].fillna(1)
+
+        cc = Cadence['child_class']
 
         # Outflow lookups
-        resolved_dict = {k: self.date_to_string(v) for k, v in outflow_lookup['Resolved date'].to_dict().items()}
-        Cadence['Resolved Date'] = cc.map(resolved_dict).fillna(self.NOT_FOUND).astype(str)
+        resolved_dates = self.dates_to_strings(outflow_lookup['Resolved date'])
+        Cadence['Resolved Date'] = cc.map(resolved_dates).fillna(self.NOT_FOUND).astype(str)
 
         # NC Count
-        Cadence['NC Count'] = cc.map(nc_lookup).apply(lambda x: self.NOT_FOUND if pd.isna(x) else str(x))
+        nc_count = cc.map(nc_lookup)
+        Cadence['NC Count'] = nc_count.astype(str).where(nc_count.notna(), self.NOT_FOUND)
 
         # Risk score
         Cadence['risk score'] = self.safe_to_numeric(Cadence['risk score']).fillna(1)
 
         # Cadence score
         self.log('   Calculating cadence scores...')
-        Cadence['Cadence Score'] = Cadence['risk score'].map(self.RISK_TO_CADENCE).fillna(30).astype(int)
+        Cadence['Cadence Score'] = self.risk_to_cadence(Cadence['risk score'])
 
         # JSR status
-        Cadence['JSR'] = Cadence['Policies'].str.contains('_JSR|-JSR', na=False, regex=True).map(
-            {True: 'Yes', False: 'No'})
+        policies = Cadence['Policies']
+        has_jsr = (policies.str.contains('_JSR', na=False, regex=False) |
+                   policies.str.contains('-JSR', na=False, regex=False))
+        Cadence['JSR'] = np.where(has_jsr, 'Yes', 'No')
 
         self.log(f'✅ GDN Cadence created: {len(Cadence):,} records')
         return Cadence
@@ -251,23 +266,19 @@ class GDNProcessor(BaseProcessor):
 
         master_lookup = master.drop_duplicates(subset=['child_class']).set_index('child_class')
 
-        cc = Cadence['child_class']
+        # One lookup of every Cadence node against the master, reused for all columns below
+        previous = master_lookup.reindex(Cadence['child_class'].to_numpy()).reset_index(drop=True)
 
         # Previous Cadence
-        Cadence['Previous Cadence'] = cc.map(master_lookup['Cadence Score'].to_dict()).apply(
-            lambda x: self.NOT_FOUND if pd.isna(x) else str(int(x)) if isinstance(x, (int, float)) and not pd.isna(
-                x) else str(x)
-        )
+        Cadence['Previous Cadence'] = self.scores_to_strings(previous['Cadence Score'])
 
         # Previous Due Date
-        due_date_dict = {k: self.date_to_string(v) for k, v in master_lookup['Due Date'].to_dict().items()}
-        Cadence['Previous Due Date'] = cc.map(due_date_dict).fillna(self.NOT_FOUND).astype(str)
+        Cadence['Previous Due Date'] = self.dates_to_strings(previous['Due Date'])
 
         # Previous NC
         if 'NC Count' in master.columns:
-            Cadence['Previous NC'] = cc.map(master_lookup['NC Count'].to_dict()).apply(
-                lambda x: self.NOT_FOUND if pd.isna(x) else str(x)
-            )
+            prev_nc = previous['NC Count']
+            Cadence['Previous NC'] = prev_nc.astype(str).where(prev_nc.notna(), self.NOT_FOUND)
         else:
             Cadence['Previous NC'] = self.NOT_FOUND
 
@@ -278,70 +289,63 @@ class GDNProcessor(BaseProcessor):
         """Update cadence scores for GDN based on business rules"""
         self.log('📈 Updating GDN cadence scores...')
 
-        nc_numeric = self.safe_to_numeric(Cadence['NC Count'])
-        prev_nc_numeric = self.safe_to_numeric(Cadence['Previous NC'])
-        prev_cad_numeric = self.safe_to_numeric(Cadence['Previous Cadence'])
-        risk = Cadence['risk score'].astype(float)
-
-        new_score = Cadence['Cadence Score'].astype(float).copy()
-
-        has_prev_cad = prev_cad_numeric.notna()
-        has_nc = nc_numeric.notna()
-        has_prev_nc = prev_nc_numeric.notna()
-
-        # Business rules (same as BLR/IAS)
-        mask_30 = has_prev_cad & (prev_cad_numeric == 30)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 30,
-                             new_score)
-        new_score = np.where(mask_30 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10), 60, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & (~has_prev_nc), 60, new_score)
-
-        mask_60 = has_prev_cad & (prev_cad_numeric == 60)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 60,
-                             new_score)
-        new_score = np.where(mask_60 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 60, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10), 90, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & (~has_prev_nc), 90, new_score)
-
-        mask_90 = has_prev_cad & (prev_cad_numeric == 90)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric >= 10), 60, new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 90,
-                             new_score)
-        new_score = np.where(mask_90 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 90, new_score)
-        new_score = np.where(
-            mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10) & (risk.isin([1, 2, 3])), 90,
-            new_score)
-        new_score = np.where(
-            mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10) & (risk.isin([4, 5])), 180,
-            new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & (~has_prev_nc) & (risk.isin([1, 2, 3])), 90,
-                             new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & (~has_prev_nc) & (risk.isin([4, 5])), 180,
-                             new_score)
-
-        mask_180 = has_prev_cad & (prev_cad_numeric == 180)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric >= 15), 90, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric >= 15), 180,
-                             new_score)
-        new_score = np.where(mask_180 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 15), 180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15) & (risk == 4),
-                             180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15) & (risk != 4),
-                             365, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & (~has_prev_nc) & (risk == 4), 180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & (~has_prev_nc) & (risk != 4), 365, new_score)
-
-        mask_365 = has_prev_cad & (prev_cad_numeric == 365)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric >= 15), 180, new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric >= 15), 365,
-                             new_score)
-        new_score = np.where(mask_365 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 15), 365, new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15), 365,
-                             new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & (~has_prev_nc), 365, new_score)
+        nc = self.safe_to_numeric(Cadence['NC Count']).to_numpy()
+        prev_nc = self.safe_to_numeric(Cadence['Previous NC']).to_numpy()
+        prev_cad = self.safe_to_numeric(Cadence['Previous Cadence']).to_numpy()
+        risk = Cadence['risk score'].astype(float).to_numpy()
+
+        has_nc = ~np.isnan(nc)
+        has_prev_nc = ~np.isnan(prev_nc)
+        low_risk = np.isin(risk, [1, 2, 3])
+        high_risk = np.isin(risk, [4, 5])
+
+        # Business rules (same as BLR/IAS) - the rules are mutually exclusive,
+        # so a single np.select gives the same result as applying them in turn
+        mask_30 = prev_cad == 30
+        mask_60 = prev_cad == 60
+        mask_90 = prev_cad == 90
+        mask_180 = prev_cad == 180
+        mask_365 = prev_cad == 365
+        rules = [
+            (mask_30 & has_nc & (nc >= 10), 30),
+            (mask_30 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 30),
+            (mask_30 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 30),
+            (mask_30 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10), 60),
+            (mask_30 & has_nc & (nc < 10) & (~has_prev_nc), 60),
+
+            (mask_60 & has_nc & (nc >= 10), 30),
+            (mask_60 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 60),
+            (mask_60 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 60),
+            (mask_60 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10), 90),
+            (mask_60 & has_nc & (nc < 10) & (~has_prev_nc), 90),
+
+            (mask_90 & has_nc & (nc >= 10), 60),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 90),
+            (mask_90 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 90),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & low_risk, 90),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & high_risk, 180),
+            (mask_90 & has_nc & (nc < 10) & (~has_prev_nc) & low_risk, 90),
+            (mask_90 & has_nc & (nc < 10) & (~has_prev_nc) & high_risk, 180),
+
+            (mask_180 & has_nc & (nc >= 15), 90),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 180),
+            (mask_180 & (~has_nc) & has_prev_nc & (prev_nc >= 15), 180),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk == 4), 180),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk != 4), 365),
+            (mask_180 & has_nc & (nc < 15) & (~has_prev_nc) & (risk == 4), 180),
+            (mask_180 & has_nc & (nc < 15) & (~has_prev_nc) & (risk != 4), 365),
+
+            (mask_365 & has_nc & (nc >= 15), 180),
+            (mask_365 & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 365),
+            (mask_365 & (~has_nc) & has_prev_nc & (prev_nc >= 15), 365),
+            (mask_365 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15), 365),
+            (mask_365 & has_nc & (nc < 15) & (~has_prev_nc), 365),
+        ]
+        new_score = np.select(
+            [condition for condition, _ in rules],
+            [score for _, score in rules],
+            default=Cadence['Cadence Score'].astype(float).to_numpy()
+        )
 
         Cadence['Cadence Score'] = pd.Series(new_score).astype(int)
 
@@ -352,77 +356,49 @@ class GDNProcessor(BaseProcessor):
         """Calculate due dates for GDN - Same logic as BLR/IAS"""
         self.log('📅 Calculating GDN due dates...')
 
-        Cadence['Due Date'] = self.NOT_FOUND
-
-        nc_numeric = self.safe_to_numeric(Cadence['NC Count'])
-        cadence_score = Cadence['Cadence Score'].astype(float)
+        nc = self.safe_to_numeric(Cadence['NC Count']).to_numpy()
+        cad = Cadence['Cadence Score'].astype(float).to_numpy()
+        resolved = pd.to_datetime(Cadence['Resolved Date'], errors='coerce')
 
         self.log('   Processing due dates...')
 
-        due_dates = []
-        for idx in range(len(Cadence)):
-            nc = nc_numeric.iloc[idx]
-            cad = cadence_score.iloc[idx]
-            resolved = Cadence['Resolved Date'].iloc[idx]
-
-            if pd.isna(nc) or self.is_not_found(resolved):
-                due_dates.append(self.NOT_FOUND)
-                continue
-
-            days = None
-
+        conditions = [
             # NC < 10: standard days
-            if nc < 10:
-                if cad == 30:
-                    days = 30
-                elif cad == 60:
-                    days = 60
-                elif cad == 90:
-                    days = 90
-
+            (nc < 10) & (cad == 30),
+            (nc < 10) & (cad == 60),
+            (nc < 10) & (cad == 90),
             # NC < 15: standard days for 180/365
-            if nc < 15:
-                if cad == 180:
-                    days = 180
-                elif cad == 365:
-                    days = 365
-
+            (nc < 15) & (cad == 180),
+            (nc < 15) & (cad == 365),
             # NC >= 10: reduced days (SAME AS BLR/IAS)
-            if nc >= 10:
-                if cad == 30:
-                    days = 30
-                elif cad == 60:
-                    days = 30  # Reduced
-                elif cad == 90:
-                    days = 60  # Reduced
-
+            (nc >= 10) & (cad == 30),
+            (nc >= 10) & (cad == 60),
+            (nc >= 10) & (cad == 90),
             # NC >= 15: reduced days (SAME AS BLR/IAS)
-            if nc >= 15:
-                if cad == 180:
-                    days = 90  # Reduced
-                elif cad == 365:
-                    days = 180  # Reduced
-
-            if days is not None:
-                due_dates.append(self.add_days_to_date(resolved, days))
-            else:
-                due_dates.append(self.NOT_FOUND)
+            (nc >= 15) & (cad == 180),
+            (nc >= 15) & (cad == 365),
+        ]
+        days = np.select(conditions, [30, 60, 90, 180, 365, 30, 30, 60, 90, 180], default=-1)
 
-        Cadence['Due Date'] = due_dates
+        due_dates = (resolved + pd.to_timedelta(days, unit='D')).dt.strftime('%Y-%m-%d')
+        Cadence['Due Date'] = due_dates.where((days >= 0) & resolved.notna(), self.NOT_FOUND)
 
         # Fallback to previous values
         self.log('   Handling fallback to previous values...')
-        for idx in range(len(Cadence)):
-            if self.is_not_found(Cadence['NC Count'].iloc[idx]):
-                prev_cad = Cadence['Previous Cadence'].iloc[idx]
-                if not self.is_not_found(prev_cad):
-                    try:
-                        Cadence.at[idx, 'Cadence Score'] = int(float(prev_cad))
-                    except (ValueError, TypeError):
-                        pass
-                prev_due = Cadence['Previous Due Date'].iloc[idx]
-                if not self.is_not_found(prev_due):
-                    Cadence.at[idx, 'Due Date'] = str(prev_due)
+        # Work on plain arrays extracted once instead of index-aligned .loc assignments
+        missing_nc = self.is_not_found_series(Cadence['NC Count']).to_numpy()
+
+        prev_cad = self.safe_to_numeric(Cadence['Previous Cadence']).to_numpy()
+        use_prev_cad = missing_nc & ~np.isnan(prev_cad)
+        cadence_score = Cadence['Cadence Score'].to_numpy(copy=True)
+        cadence_score[use_prev_cad] = prev_cad[use_prev_cad].astype(int)
+        Cadence['Cadence Score'] = cadence_score
+
+        prev_due = Cadence['Previous Due Date']
+        use_prev_due = missing_nc & ~self.is_not_found_series(prev_due).to_numpy()
+        due_date = Cadence['Due Date'].to_numpy(dtype=object, copy=True)
+        due_date[use_prev_due] = prev_due.to_numpy(dtype=object)[use_prev_due].astype(str)
+        Cadence['Due Date'] = due_date
 
         self.log('✅ GDN Due dates calculated')
         return Cadence
@@ -433,7 +409,8 @@ class GDNProcessor(BaseProcessor):
 
         Cadence.loc[Cadence['risk score'] == 0, 'risk score'] = 1
         Cadence['Cadence Score'] = pd.to_numeric(Cadence['Cadence Score'], errors='coerce').fillna(30).astype(int)
-        Cadence['Due Date'] = Cadence['Due Date'].apply(lambda x: self.date_to_string(x))
+        Cadence['Due Date'] = self.dates_to_strings(Cadence['Due Date'])
+        Cadence = Cadence.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
 
         self.log('✅ GDN Cadence finalized')
         return Cadence
@@ -446,13 +423,14 @@ class GDNProcessor(BaseProcessor):
 
         try:
             self.log("📖 Reading input files...")
-            armt = pd.read_excel(files_dict['armt_file'], sheet_name='Sheet1')
+            # Master keeps every column as it is returned for download
+            armt, master, outflow = self.read_input_files(files_dict, {
+                'armt_file': self.ARMT_COLUMNS,
+                'master_file': None,
+                'outflow_file': self.OUTFLOW_COLUMNS
+            })
             self.log(f"   ARMT: {len(armt):,} rows")
-
-            master = pd.read_excel(files_dict['master_file'], sheet_name='Sheet1')
             self.log(f"   Master: {len(master):,} rows")
-
-            outflow = pd.read_excel(files_dict['outflow_file'], sheet_name='Sheet1')
             self.log(f"   Outflow: {len(outflow):,} rows")
 
             self.log('=' * 50)
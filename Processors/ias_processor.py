@@ -36,7 +36,8 @@ class IASProcessor(BaseProcessor):
         ]
         self.IAS_CrossListing_Sources = ['FR', 'IT', 'ES', 'MX']
 
-    def get_required_files(self):
+    @classmethod
+    def get_required_files(cls):
         """Return list of required files for IAS processor"""
         return [
             {
@@ -59,7 +60,8 @@ class IASProcessor(BaseProcessor):
             }
         ]
 
-    def get_node_config(self):
+    @classmethod
+    def get_node_config(cls):
         """Return IAS node configuration"""
         return {
             'name': 'IAS',
@@ -80,31 +82,42 @@ class IASProcessor(BaseProcessor):
 
         armt['Source'] = armt['source_country'].astype(str).str.strip()
         armt['Destination'] = armt['include_destination_country'].astype(str).str.strip()
+        armt['program'] = armt['program'].astype('category')
 
         # Process AmazonGlobal
         self.log('   Processing AmazonGlobal...')
         armt_core = armt[armt['program'] == 'AmazonGlobal'].copy()
         if len(armt_core) > 0:
-            armt_core = armt_core.assign(Source=armt_core['Source'].str.split(',')).explode('Source')
-            armt_core['Source'] = armt_core['Source'].str.strip()
             armt_core.loc[armt_core['Destination'].str.contains(',', na=False), 'Destination'] = 'SOME'
+            # Split and strip the flat Source series, then repeat the rows it came from
+            # (by a unique index, so duplicate input labels don't multiply the rows)
+            armt_core = armt_core.reset_index(drop=True)
+            sources = armt_core['Source'].str.split(',').explode().str.strip()
+            armt_core = armt_core.loc[sources.index]
+            armt_core['Source'] = sources.to_numpy()
 
         # Process CrossListing
         self.log('   Processing CrossListing...')
         armt_cross = armt[armt['program'] == 'CrossListing'].copy()
         if len(armt_cross) > 0:
-            armt_cross = armt_cross.assign(Destination=armt_cross['Destination'].str.split(',')).explode('Destination')
-            armt_cross = armt_cross.assign(Source=armt_cross['Source'].str.split(',')).explode('Source')
-            armt_cross['Source'] = armt_cross['Source'].str.strip()
-            armt_cross['Destination'] = armt_cross['Destination'].str.strip()
+            armt_cross = armt_cross.reset_index(drop=True)
+            destinations = armt_cross['Destination'].str.split(',').explode().str.strip()
+            sources = armt_cross['Source'].str.split(',').explode().str.strip()
+            # Every destination of a row paired with every source of the same row
+            pairs = destinations.to_frame().join(sources.to_frame())
+            armt_cross = armt_cross.loc[pairs.index]
+            armt_cross['Destination'] = pairs['Destination'].to_numpy()
+            armt_cross['Source'] = pairs['Source'].to_numpy()
 
         armt = pd.concat([armt_core, armt_cross], ignore_index=True)
 
-        armt['ARC'] = armt['Source'] + '-' + armt['Destination']
-        armt['combined_class'] = armt['parent_class'].astype(str) + "," + armt['child_class'].astype(str) + ',' + armt[
-            'Source']
-        armt['combined_class2'] = armt['parent_class'].astype(str) + "," + armt['child_class'].astype(str) + ',' + armt[
-            'ARC']
+        armt['ARC'] = self.join_columns([armt['Source'], armt['Destination']], sep='-')
+        armt['combined_class'] = self.join_columns([armt['parent_class'], armt['child_class'], armt['Source']])
+        armt['combined_class2'] = self.join_columns([armt['parent_class'], armt['child_class'], armt['ARC']])
+
+        # Country codes repeat heavily - store them as categories once the keys are built
+        armt['Source'] = armt['Source'].astype('category')
+        armt['Destination'] = armt['Destination'].astype('category')
 
         self.log(f'✅ ARMT processed: {len(armt):,} records')
         return armt
@@ -116,10 +129,12 @@ class IASProcessor(BaseProcessor):
         initial_count = len(outflow)
 
         outflow = outflow.dropna(subset=['root_cause', 'root_cause_details'])
+        outflow['root_cause'] = outflow['root_cause'].astype('category')
 
         # IAS specific groups to remove
         del_groups = ['RP - AG Auditors', 'RP - AG Auditors CN', 'RP - AG Auditors PL']
         if 'assigned_to_group' in outflow.columns:
+            outflow['assigned_to_group'] = outflow['assigned_to_group'].astype('category')
             outflow = outflow[~outflow['assigned_to_group'].isin(del_groups)]
 
         del_causes = ['Duplicate', 'Other', 'Negative Class']
@@ -129,25 +144,44 @@ class IASProcessor(BaseProcessor):
         outflow['parent_class'] = outflow['root_cause_details'].astype(str).str.split('\\\\').str[0].str.strip()
         outflow.loc[outflow['child_class'] == outflow['parent_class'], 'child_class'] = 'No-Child'
 
-        outflow['Resolved date'] = pd.to_datetime(outflow['resolved_date'], errors='coerce')
-        outflow['Resolved date'] = outflow['Resolved date'].apply(self.date_to_string)
+        resolved = pd.to_datetime(outflow['resolved_date'], errors='coerce')
+        outflow['Resolved date'] = resolved.dt.strftime('%Y-%m-%d').fillna(self.NOT_FOUND)
         outflow = outflow.sort_values(by='Resolved date', ascending=False)
 
         outflow['resolution'] = outflow['resolution'].astype(str).str.split('\\\\').str[0]
         outflow.loc[outflow['child_class'] == outflow['parent_class'], 'child_class'] = 'No-Child'
 
         outflow['source'] = outflow['resolution'].str.split('-').str[0]
-        outflow['combined_class'] = outflow['parent_class'].astype(str) + "," + outflow['child_class'].astype(
-            str) + ',' + outflow['source']
-        outflow['combined_class2'] = outflow['parent_class'].astype(str) + "," + outflow['child_class'].astype(
-            str) + ',' + outflow['resolution']
+        outflow['combined_class'] = self.join_columns(
+            [outflow['parent_class'], outflow['child_class'], outflow['source']])
+        outflow['combined_class2'] = self.join_columns(
+            [outflow['parent_class'], outflow['child_class'], outflow['resolution']])
 
         outflow['quantity'] = pd.to_numeric(outflow['quantity'], errors='coerce').fillna(0)
         outflow['vendor_id'] = pd.to_numeric(outflow['vendor_id'], errors='coerce').fillna(0).astype(int)
         outflow['NC'] = outflow['quantity'] + outflow['vendor_id']
 
-        outflow1 = outflow.groupby('combined_class', as_index=False)['NC'].sum()
-        outflow2 = outflow.groupby('combined_class2', as_index=False)['NC'].sum()
+        # Factorize each key once - the codes give both the NC sums (bincount) and the latest row
+        # per key (first occurrence after the date sort), so create_cadence needs one table per key
+        nc = outflow['NC'].to_numpy(dtype=float)
+        resolved_dates = outflow['Resolved date'].to_numpy()
+        root_causes = outflow['root_cause'].to_numpy()
+        codes1, classes1 = pd.factorize(outflow['combined_class'], sort=True)
+        codes2, classes2 = pd.factorize(outflow['combined_class2'], sort=True)
+        first1 = np.unique(codes1, return_index=True)[1]
+        first2 = np.unique(codes2, return_index=True)[1]
+        outflow1 = pd.DataFrame({
+            'combined_class': classes1,
+            'NC': np.bincount(codes1, weights=nc, minlength=len(classes1)),
+            'Resolved date': resolved_dates[first1],
+            'root_cause': root_causes[first1]
+        })
+        outflow2 = pd.DataFrame({
+            'combined_class2': classes2,
+            'NC': np.bincount(codes2, weights=nc, minlength=len(classes2)),
+            'Resolved date': resolved_dates[first2],
+            'root_cause': root_causes[first2]
+        })
 
         self.log(f'✅ Outflow processed: {len(outflow):,} records (from {initial_count:,})')
 
@@ -157,40 +191,30 @@ class IASProcessor(BaseProcessor):
         """Create source and destination mapping for IAS"""
         self.log('🗺️ Creating IAS node mappings...')
 
-        nodes = set()
-
         # AmazonGlobal nodes - FR, IT, ES
-        ag_mask = armt['program'] == 'AmazonGlobal'
-        ag_data = armt[ag_mask]
-
-        # FR nodes
-        fr_mask = ag_data['Source'] == 'FR'
-        nodes.update(ag_data.loc[fr_mask, 'combined_class'].tolist())
-
-        # IT nodes
-        it_mask = ag_data['Source'] == 'IT'
-        nodes.update(ag_data.loc[it_mask, 'combined_class'].tolist())
-
-        # ES nodes
-        es_mask = ag_data['Source'] == 'ES'
-        nodes.update(ag_data.loc[es_mask, 'combined_class'].tolist())
+        ag_mask = (armt['program'] == 'AmazonGlobal') & armt['Source'].isin(['FR', 'IT', 'ES'])
 
         # CrossListing nodes - sources FR, IT, ES, MX
         cl_mask = (
                 (armt['program'] == 'CrossListing') &
                 (armt['Source'].isin(self.IAS_CrossListing_Sources))
         )
-        nodes.update(armt.loc[cl_mask, 'combined_class2'].tolist())
+
+        # Order-preserving de-duplication of both node lists in one hash pass
+        nodes = pd.unique(np.concatenate([
+            armt.loc[ag_mask, 'combined_class'].to_numpy(),
+            armt.loc[cl_mask, 'combined_class2'].to_numpy()
+        ])).tolist()
 
         self.log(f'✅ Created {len(nodes):,} unique IAS nodes')
-        return list(nodes)
+        return nodes
 
-    def create_cadence(self, nodes, armt, outflow, outflow1, outflow2):
+    def create_cadence(self, nodes, armt, outflow1, outflow2):
         """Create cadence dataframe for IAS"""
         self.log('⚙️ Creating IAS Cadence dataframe...')
 
-        Cadence = pd.DataFrame({'Combined Classes': nodes})
-        total = len(Cadence)
+        keys = np.asarray(nodes, dtype=object)
+        total = len(keys)
         self.log(f'   Processing {total:,} records...')
 
         self.log('   Building lookup tables...')
@@ -198,61 +222,55 @@ class IASProcessor(BaseProcessor):
         armt_lookup1 = armt.drop_duplicates(subset=['combined_class']).set_index('combined_class')
         armt_lookup2 = armt.drop_duplicates(subset=['combined_class2']).set_index('combined_class2')
 
-        outflow_lookup1 = outflow.drop_duplicates(subset=['combined_class']).set_index('combined_class')
-        outflow_lookup2 = outflow.drop_duplicates(subset=['combined_class2']).set_index('combined_class2')
-
-        nc_lookup1 = outflow1.set_index('combined_class')['NC'].to_dict()
-        nc_lookup2 = outflow2.set_index('combined_class2')['NC'].to_dict()
+        outflow_lookup1 = outflow1.set_index('combined_class')
+        outflow_lookup2 = outflow2.set_index('combined_class2')
 
         self.log('   Applying lookups...')
 
-        cc = Cadence['Combined Classes']
-
-        # Primary lookups
-        Cadence['program'] = cc.map(armt_lookup1['program'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Policies'] = cc.map(armt_lookup1['policy_name'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Child Classes'] = cc.map(armt_lookup1['child_class'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Parent Classes'] = cc.map(armt_lookup1['parent_class'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Source'] = cc.map(armt_lookup1['Source'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Destination'] = cc.map(armt_lookup1['Destination'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['ARC'] = cc.map(armt_lookup1['ARC'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['risk score'] = cc.map(armt_lookup1['parent_score'].to_dict()).fillna(1)
-
-        # Secondary lookups
-        Cadence['program2'] = cc.map(armt_lookup2['program'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Policies2'] = cc.map(armt_lookup2['policy_name'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Child Classes2'] = cc.map(armt_lookup2['child_class'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Parent Classes2'] = cc.map(armt_lookup2['parent_class'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Source2'] = cc.map(armt_lookup2['Source'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Destination2'] = cc.map(armt_lookup2['Destination'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['ARC2'] = cc.map(armt_lookup2['ARC'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['risk score2'] = cc.map(armt_lookup2['parent_score'].to_dict()).fillna(1)
-
-        # Outflow lookups
-        resolved_dict1 = {k: self.date_to_string(v) for k, v in outflow_lookup1['Resolved date'].to_dict().items()}
-        resolved_dict2 = {k: self.date_to_string(v) for k, v in outflow_lookup2['Resolved date'].to_dict().items()}
-
-        Cadence['Resolved Date'] = cc.map(resolved_dict1).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Root Cause'] = cc.map(outflow_lookup1['root_cause'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Resolved Date2'] = cc.map(resolved_dict2).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Root Cause2'] = cc.map(outflow_lookup2['root_cause'].to_dict()).fillna(self.NOT_FOUND).astype(str)
-
-        # NC counts
-        Cadence['NC Count'] = cc.map(nc_lookup1).apply(lambda x: self.NOT_FOUND if pd.isna(x) else str(x))
-        Cadence['NC Count2'] = cc.map(nc_lookup2).apply(lambda x: self.NOT_FOUND if pd.isna(x) else str(x))
+        # Columns are collected here and the Cadence frame is built once at the end
+        columns = {'Combined Classes': keys}
+
+        # Primary and secondary lookups - one reindex per lookup table covers every ARMT column
+        armt_columns = ['program', 'policy_name', 'child_class', 'parent_class', 'Source', 'Destination', 'ARC',
+                        'parent_score']
+        cadence_columns = ['program', 'Policies', 'Child Classes', 'Parent Classes', 'Source', 'Destination', 'ARC',
+                           'risk score']
+        for armt_lookup, suffix in [(armt_lookup1, ''), (armt_lookup2, '2')]:
+            found = armt_lookup[armt_columns].reindex(keys).reset_index(drop=True)
+            found.columns = [col + suffix for col in cadence_columns]
+            # Source, Destination and ARC were built as strings in process_armt - only raw ARMT text needs str()
+            raw_cols = [col + suffix for col in ['program', 'Policies', 'Child Classes', 'Parent Classes']]
+            built_cols = [col + suffix for col in ['Source', 'Destination', 'ARC']]
+            found[raw_cols] = found[raw_cols].astype(object).fillna(self.NOT_FOUND).astype(str)
+            found[built_cols] = found[built_cols].astype(object).fillna(self.NOT_FOUND)
+            found['risk score' + suffix] = found['risk score' + suffix].fillna(1)
+            columns.update(found.items())
+
+        # Outflow lookups - one reindex per key covers the latest row and the NC sum
+        for outflow_lookup, suffix in [(outflow_lookup1, ''), (outflow_lookup2, '2')]:
+            found = outflow_lookup[['Resolved date', 'root_cause', 'NC']].reindex(keys).reset_index(drop=True)
+            columns['Resolved Date' + suffix] = self.dates_to_strings(found['Resolved date'])
+            columns['Root Cause' + suffix] = found['root_cause'].fillna(self.NOT_FOUND).astype(str)
+            columns['NC Count' + suffix] = found['NC'].astype(str).where(found['NC'].notna(), self.NOT_FOUND)
+            # Numeric NC kept for update_cadence_score/calculate_due_dates - dropped in finalize_cadence
+            columns['_NC_num' + suffix] = found['NC'].astype(float)
 
         # Risk scores
-        Cadence['risk score'] = self.safe_to_numeric(Cadence['risk score']).fillna(1)
-        Cadence['risk score2'] = self.safe_to_numeric(Cadence['risk score2']).fillna(1)
+        columns['risk score'] = self.safe_to_numeric(columns['risk score']).fillna(1)
+        columns['risk score2'] = self.safe_to_numeric(columns['risk score2']).fillna(1)
 
         # Cadence scores
         self.log('   Calculating cadence scores...')
-        Cadence['Cadence Score'] = Cadence['risk score'].map(self.RISK_TO_CADENCE).fillna(30).astype(int)
-        Cadence['Cadence Score2'] = Cadence['risk score2'].map(self.RISK_TO_CADENCE).fillna(30).astype(int)
+        columns['Cadence Score'] = self.risk_to_cadence(columns['risk score'])
+        columns['Cadence Score2'] = self.risk_to_cadence(columns['risk score2'])
 
         # JSR status
-        Cadence['JSR'] = Cadence['Policies'].str.contains('_JSR|-JSR', na=False, regex=True).map(
-            {True: 'Yes', False: 'No'})
+        policies = columns['Policies']
+        has_jsr = (policies.str.contains('_JSR', na=False, regex=False) |
+                   policies.str.contains('-JSR', na=False, regex=False))
+        columns['JSR'] = np.where(has_jsr, 'Yes', 'No')
+
+        Cadence = pd.DataFrame(columns, copy=False)
 
         self.log(f'✅ IAS Cadence created: {len(Cadence):,} records')
         return Cadence
@@ -261,44 +279,34 @@ class IASProcessor(BaseProcessor):
         """Apply master lookups for IAS"""
         self.log('🔗 Applying IAS master lookups...')
 
-        master['Combined Classes'] = (
-                master['Parent Classes'].astype(str) + "," +
-                master['Child Classes'].astype(str) + ',' +
-                master['Source'].astype(str)
-        )
-        master['Combined Classes2'] = (
-                master['Parent Classes'].astype(str) + "," +
-                master['Child Classes'].astype(str) + ',' +
-                master['ARC'].astype(str)
-        )
+        master['Combined Classes'] = self.join_columns(
+            [master['Parent Classes'], master['Child Classes'], master['Source']])
+        master['Combined Classes2'] = self.join_columns(
+            [master['Parent Classes'], master['Child Classes'], master['ARC']])
 
         master_lookup1 = master.drop_duplicates(subset=['Combined Classes']).set_index('Combined Classes')
         master_lookup2 = master.drop_duplicates(subset=['Combined Classes2']).set_index('Combined Classes2')
 
-        cc = Cadence['Combined Classes']
+        # One lookup of every Cadence node per master table, reused for all columns below
+        keys = Cadence['Combined Classes'].to_numpy()
+        previous1 = master_lookup1.reindex(keys).reset_index(drop=True)
+        previous2 = master_lookup2.reindex(keys).reset_index(drop=True)
 
         # Previous Cadence
-        Cadence['Previous Cadence'] = cc.map(master_lookup1['Cadence Score'].to_dict()).apply(
-            lambda x: self.NOT_FOUND if pd.isna(x) else str(int(x)) if isinstance(x, (int, float)) and not pd.isna(
-                x) else str(x)
-        )
-        Cadence['Previous Cadence2'] = cc.map(master_lookup2['Cadence Score'].to_dict()).apply(
-            lambda x: self.NOT_FOUND if pd.isna(x) else str(int(x)) if isinstance(x, (int, float)) and not pd.isna(
-                x) else str(x)
-        )
+        Cadence['Previous Cadence'] = self.scores_to_strings(previous1['Cadence Score'])
+        Cadence['Previous Cadence2'] = self.scores_to_strings(previous2['Cadence Score'])
+        # Parsed once for update_cadence_score/calculate_due_dates - dropped in finalize_cadence
+        Cadence['_prev_cadence_num'] = self.safe_to_numeric(Cadence['Previous Cadence'])
+        Cadence['_prev_cadence_num2'] = self.safe_to_numeric(Cadence['Previous Cadence2'])
 
         # Previous Due Date
-        due_date_dict1 = {k: self.date_to_string(v) for k, v in master_lookup1['Due Date'].to_dict().items()}
-        due_date_dict2 = {k: self.date_to_string(v) for k, v in master_lookup2['Due Date'].to_dict().items()}
-
-        Cadence['Previous Due Date'] = cc.map(due_date_dict1).fillna(self.NOT_FOUND).astype(str)
-        Cadence['Previous Due Date2'] = cc.map(due_date_dict2).fillna(self.NOT_FOUND).astype(str)
+        Cadence['Previous Due Date'] = self.dates_to_strings(previous1['Due Date'])
+        Cadence['Previous Due Date2'] = self.dates_to_strings(previous2['Due Date'])
 
         # Previous NC
         if 'NC Count' in master.columns:
-            Cadence['Previous NC'] = cc.map(master_lookup1['NC Count'].to_dict()).apply(
-                lambda x: self.NOT_FOUND if pd.isna(x) else str(x)
-            )
+            prev_nc = previous1['NC Count']
+            Cadence['Previous NC'] = prev_nc.astype(str).where(prev_nc.notna(), self.NOT_FOUND)
         else:
             Cadence['Previous NC'] = self.NOT_FOUND
 
@@ -324,10 +332,19 @@ class IASProcessor(BaseProcessor):
             ('Destination', 'Destination2'),
         ]
 
-        for primary, secondary in merge_pairs:
-            if primary in Cadence.columns and secondary in Cadence.columns:
-                mask = Cadence[primary].apply(lambda x: self.is_not_found(x))
-                Cadence.loc[mask, primary] = Cadence.loc[mask, secondary]
+        pairs = [(p, s) for p, s in merge_pairs if p in Cadence.columns and s in Cadence.columns]
+        primary_cols = [primary for primary, _ in pairs]
+        secondary_cols = [secondary for _, secondary in pairs]
+
+        # One not-found mask for all primary columns, filled from the secondary columns in a single pass
+        mask = Cadence[primary_cols].apply(self.is_not_found_series).to_numpy()
+        Cadence[primary_cols] = np.where(mask, Cadence[secondary_cols].to_numpy(), Cadence[primary_cols].to_numpy())
+
+        # The parsed numbers follow their text column, so they are filled on exactly the same rows
+        for numeric, numeric2, text in [('_NC_num', '_NC_num2', 'NC Count'),
+                                        ('_prev_cadence_num', '_prev_cadence_num2', 'Previous Cadence')]:
+            if text in primary_cols and numeric2 in Cadence.columns:
+                Cadence[numeric] = np.where(mask[:, primary_cols.index(text)], Cadence[numeric2], Cadence[numeric])
 
         self.log('✅ Columns merged')
         return Cadence
@@ -336,70 +353,63 @@ class IASProcessor(BaseProcessor):
         """Update cadence scores based on business rules"""
         self.log('📈 Updating IAS cadence scores...')
 
-        nc_numeric = self.safe_to_numeric(Cadence['NC Count'])
-        prev_nc_numeric = self.safe_to_numeric(Cadence['Previous NC'])
-        prev_cad_numeric = self.safe_to_numeric(Cadence['Previous Cadence'])
-        risk = Cadence['risk score'].astype(float)
-
-        new_score = Cadence['Cadence Score'].astype(float).copy()
-
-        has_prev_cad = prev_cad_numeric.notna()
-        has_nc = nc_numeric.notna()
-        has_prev_nc = prev_nc_numeric.notna()
-
-        # Business rules (same as BLR)
-        mask_30 = has_prev_cad & (prev_cad_numeric == 30)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 30,
-                             new_score)
-        new_score = np.where(mask_30 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10), 60, new_score)
-        new_score = np.where(mask_30 & has_nc & (nc_numeric < 10) & (~has_prev_nc), 60, new_score)
-
-        mask_60 = has_prev_cad & (prev_cad_numeric == 60)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric >= 10), 30, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 60,
-                             new_score)
-        new_score = np.where(mask_60 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 60, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10), 90, new_score)
-        new_score = np.where(mask_60 & has_nc & (nc_numeric < 10) & (~has_prev_nc), 90, new_score)
-
-        mask_90 = has_prev_cad & (prev_cad_numeric == 90)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric >= 10), 60, new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric >= 10), 90,
-                             new_score)
-        new_score = np.where(mask_90 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 10), 90, new_score)
-        new_score = np.where(
-            mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10) & (risk.isin([1, 2, 3])), 90,
-            new_score)
-        new_score = np.where(
-            mask_90 & has_nc & (nc_numeric < 10) & has_prev_nc & (prev_nc_numeric < 10) & (risk.isin([4, 5])), 180,
-            new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & (~has_prev_nc) & (risk.isin([1, 2, 3])), 90,
-                             new_score)
-        new_score = np.where(mask_90 & has_nc & (nc_numeric < 10) & (~has_prev_nc) & (risk.isin([4, 5])), 180,
-                             new_score)
-
-        mask_180 = has_prev_cad & (prev_cad_numeric == 180)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric >= 15), 90, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric >= 15), 180,
-                             new_score)
-        new_score = np.where(mask_180 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 15), 180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15) & (risk == 4),
-                             180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15) & (risk != 4),
-                             365, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & (~has_prev_nc) & (risk == 4), 180, new_score)
-        new_score = np.where(mask_180 & has_nc & (nc_numeric < 15) & (~has_prev_nc) & (risk != 4), 365, new_score)
-
-        mask_365 = has_prev_cad & (prev_cad_numeric == 365)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric >= 15), 180, new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric >= 15), 365,
-                             new_score)
-        new_score = np.where(mask_365 & (~has_nc) & has_prev_nc & (prev_nc_numeric >= 15), 365, new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & has_prev_nc & (prev_nc_numeric < 15), 365,
-                             new_score)
-        new_score = np.where(mask_365 & has_nc & (nc_numeric < 15) & (~has_prev_nc), 365, new_score)
+        nc = Cadence['_NC_num'].to_numpy()
+        prev_nc = self.safe_to_numeric(Cadence['Previous NC']).to_numpy()
+        prev_cad = Cadence['_prev_cadence_num'].to_numpy()
+        risk = Cadence['risk score'].astype(float).to_numpy()
+
+        has_nc = ~np.isnan(nc)
+        has_prev_nc = ~np.isnan(prev_nc)
+        low_risk = np.isin(risk, [1, 2, 3])
+        high_risk = np.isin(risk, [4, 5])
+
+        # Business rules - the rules are mutually exclusive,
+        # so a single np.select gives the same result as applying them in turn
+        mask_30 = prev_cad == 30
+        mask_60 = prev_cad == 60
+        mask_90 = prev_cad == 90
+        mask_180 = prev_cad == 180
+        mask_365 = prev_cad == 365
+        rules = [
+            (mask_30 & has_nc & (nc >= 10), 30),
+            (mask_30 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 30),
+            (mask_30 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 30),
+            (mask_30 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10), 60),
+            (mask_30 & has_nc & (nc < 10) & (~has_prev_nc), 60),
+
+            (mask_60 & has_nc & (nc >= 10), 30),
+            (mask_60 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 60),
+            (mask_60 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 60),
+            (mask_60 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10), 90),
+            (mask_60 & has_nc & (nc < 10) & (~has_prev_nc), 90),
+
+            (mask_90 & has_nc & (nc >= 10), 60),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 90),
+            (mask_90 & (~has_nc) & has_prev_nc & (prev_nc >= 10), 90),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & low_risk, 90),
+            (mask_90 & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & high_risk, 180),
+            (mask_90 & has_nc & (nc < 10) & (~has_prev_nc) & low_risk, 90),
+            (mask_90 & has_nc & (nc < 10) & (~has_prev_nc) & high_risk, 180),
+
+            (mask_180 & has_nc & (nc >= 15), 90),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 180),
+            (mask_180 & (~has_nc) & has_prev_nc & (prev_nc >= 15), 180),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk == 4), 180),
+            (mask_180 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk != 4), 365),
+            (mask_180 & has_nc & (nc < 15) & (~has_prev_nc) & (risk == 4), 180),
+            (mask_180 & has_nc & (nc < 15) & (~has_prev_nc) & (risk != 4), 365),
+
+            (mask_365 & has_nc & (nc >= 15), 180),
+            (mask_365 & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 365),
+            (mask_365 & (~has_nc) & has_prev_nc & (prev_nc >= 15), 365),
+            (mask_365 & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15), 365),
+            (mask_365 & has_nc & (nc < 15) & (~has_prev_nc), 365),
+        ]
+        new_score = np.select(
+            [condition for condition, _ in rules],
+            [score for _, score in rules],
+            default=Cadence['Cadence Score'].astype(float).to_numpy()
+        )
 
         Cadence['Cadence Score'] = pd.Series(new_score).astype(int)
 
@@ -410,69 +420,52 @@ class IASProcessor(BaseProcessor):
         """Calculate due dates for IAS"""
         self.log('📅 Calculating IAS due dates...')
 
-        Cadence['Due Date'] = self.NOT_FOUND
-
-        nc_numeric = self.safe_to_numeric(Cadence['NC Count'])
-        cadence_score = Cadence['Cadence Score'].astype(float)
+        nc = Cadence['_NC_num'].to_numpy()
+        cad = Cadence['Cadence Score'].astype(float).to_numpy()
+        resolved = pd.to_datetime(Cadence['Resolved Date'], errors='coerce')
 
         self.log('   Processing due dates...')
 
-        due_dates = []
-        for idx in range(len(Cadence)):
-            nc = nc_numeric.iloc[idx]
-            cad = cadence_score.iloc[idx]
-            resolved = Cadence['Resolved Date'].iloc[idx]
-
-            if pd.isna(nc) or self.is_not_found(resolved):
-                due_dates.append(self.NOT_FOUND)
-                continue
-
-            days = None
-            if nc < 10:
-                if cad == 30:
-                    days = 30
-                elif cad == 60:
-                    days = 60
-                elif cad == 90:
-                    days = 90
-            if nc < 15:
-                if cad == 180:
-                    days = 180
-                elif cad == 365:
-                    days = 365
-            if nc >= 10:
-                if cad == 30:
-                    days = 30
-                elif cad == 60:
-                    days = 30
-                elif cad == 90:
-                    days = 60
-            if nc >= 15:
-                if cad == 180:
-                    days = 90
-                elif cad == 365:
-                    days = 180
-
-            if days is not None:
-                due_dates.append(self.add_days_to_date(resolved, days))
-            else:
-                due_dates.append(self.NOT_FOUND)
-
-        Cadence['Due Date'] = due_dates
+        conditions = [
+            # NC < 10: standard days
+            (nc < 10) & (cad == 30),
+            (nc < 10) & (cad == 60),
+            (nc < 10) & (cad == 90),
+            # NC < 15: standard days for 180/365
+            (nc < 15) & (cad == 180),
+            (nc < 15) & (cad == 365),
+            # NC >= 10: reduced days
+            (nc >= 10) & (cad == 30),
+            (nc >= 10) & (cad == 60),
+            (nc >= 10) & (cad == 90),
+            # NC >= 15: reduced days
+            (nc >= 15) & (cad == 180),
+            (nc >= 15) & (cad == 365),
+        ]
+        days = np.select(conditions, [30, 60, 90, 180, 365, 30, 30, 60, 90, 180], default=-1)
+
+        # Missing NC or resolved date leaves days at -1 / resolved at NaT
+        due_dates = (resolved + pd.to_timedelta(days, unit='D')).dt.strftime('%Y-%m-%d')
+        Cadence['Due Date'] = due_dates.where((days >= 0) & resolved.notna(), self.NOT_FOUND)
 
         # Fallback to previous values
         self.log('   Handling fallback to previous values...')
-        for idx in range(len(Cadence)):
-            if self.is_not_found(Cadence['NC Count'].iloc[idx]):
-                prev_cad = Cadence['Previous Cadence'].iloc[idx]
-                if not self.is_not_found(prev_cad):
-                    try:
-                        Cadence.at[idx, 'Cadence Score'] = int(float(prev_cad))
-                    except (ValueError, TypeError):
-                        pass
-                prev_due = Cadence['Previous Due Date'].iloc[idx]
-                if not self.is_not_found(prev_due):
-                    Cadence.at[idx, 'Due Date'] = str(prev_due)
+        missing_nc = self.is_not_found_series(Cadence['NC Count']).to_numpy()
+        if missing_nc.any():
+            # Only rows without an NC Count are parsed and checked against the previous values
+            rows = np.flatnonzero(missing_nc)
+
+            prev_cad = Cadence['_prev_cadence_num'].to_numpy()[rows]
+            has_prev_cad = ~np.isnan(prev_cad)
+            cadence_score = Cadence['Cadence Score'].to_numpy(copy=True)
+            cadence_score[rows[has_prev_cad]] = prev_cad[has_prev_cad].astype(int)
+            Cadence['Cadence Score'] = cadence_score
+
+            prev_due = Cadence['Previous Due Date'].iloc[rows]
+            has_prev_due = ~self.is_not_found_series(prev_due).to_numpy()
+            due_date = Cadence['Due Date'].to_numpy(dtype=object, copy=True)
+            due_date[rows[has_prev_due]] = prev_due.to_numpy(dtype=object)[has_prev_due].astype(str)
+            Cadence['Due Date'] = due_date
 
         self.log('✅ IAS Due dates calculated')
         return Cadence
@@ -485,13 +478,13 @@ class IASProcessor(BaseProcessor):
             'program2', 'Policies2', 'Child Classes2', 'Parent Classes2',
             'Resolved Date2', 'Root Cause2', 'Cadence Score2', 'Previous Cadence2',
             'Previous Due Date2', 'NC Count2', 'risk score2', 'Source2',
-            'Destination2', 'ARC2'
+            'Destination2', 'ARC2', '_NC_num', '_NC_num2', '_prev_cadence_num', '_prev_cadence_num2'
         ]
         Cadence = Cadence.drop(cols_to_drop, axis=1, errors='ignore')
 
         Cadence.loc[Cadence['risk score'] == 0, 'risk score'] = 1
         Cadence['Cadence Score'] = pd.to_numeric(Cadence['Cadence Score'], errors='coerce').fillna(30).astype(int)
-        Cadence['Due Date'] = Cadence['Due Date'].apply(lambda x: self.date_to_string(x))
+        Cadence['Due Date'] = self.dates_to_strings(Cadence['Due Date'])
 
         self.log('✅ IAS Cadence finalized')
         return Cadence
@@ -504,20 +497,21 @@ class IASProcessor(BaseProcessor):
 
         try:
             self.log("📖 Reading input files...")
-            armt = pd.read_excel(files_dict['armt_file'], sheet_name='Sheet1')
+            armt, master, outflow = self.read_input_files(files_dict, {
+                'armt_file': None,
+                'master_file': None,
+                'outflow_file': None
+            })
             self.log(f"   ARMT: {len(armt):,} rows")
-
-            master = pd.read_excel(files_dict['master_file'], sheet_name='Sheet1')
             self.log(f"   Master: {len(master):,} rows")
-
-            outflow = pd.read_excel(files_dict['outflow_file'], sheet_name='Sheet1')
             self.log(f"   Outflow: {len(outflow):,} rows")
 
+            # ARMT and Outflow are independent of each other - process them side by side
             self.log('=' * 50)
-            armt = self.process_armt(armt)
-
-            self.log('=' * 50)
-            outflow, outflow1, outflow2 = self.process_outflow(outflow)
+            armt, (outflow, outflow1, outflow2) = self.run_concurrently(
+                (self.process_armt, armt),
+                (self.process_outflow, outflow)
+            )
 
             self.log('=' * 50)
             nodes = self.create_nodes(armt)
@@ -531,7 +525,7 @@ class IASProcessor(BaseProcessor):
                 }
 
             self.log('=' * 50)
-            Cadence = self.create_cadence(nodes, armt, outflow, outflow1, outflow2)
+            Cadence = self.create_cadence(nodes, armt, outflow1, outflow2)
 
             self.log('=' * 50)
             Cadence, master = self.apply_master_lookups(Cadence, master)
@@ -5,11 +5,13 @@ Supports BLR, IAS, and GDN nodes
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from Processors import BLRProcessor, IASProcessor, GDNProcessor
 from config import APP_NAME, APP_VERSION, MONTHS
 import io
+import xlsxwriter
 from datetime import datetime
 import time
 
@@ -28,11 +30,23 @@ PROCESSORS = {
     'GDN': GDNProcessor
 }
 
-NODE_COLORS = {
-    'BLR': '#667eea',
-    'IAS': '#28a745',
-    'GDN': '#dc3545'
-}
+# Progress bar value for the first log message containing each (lower-cased) key
+PROGRESS_STEPS = [
+    (key.lower(), progress) for key, progress in {
+        'Starting': 5, 'Reading': 10, 'ARMT processed': 25,
+        'Outflow processed': 40, 'node mappings': 50,
+        'Creating Cadence': 55, 'Cadence created': 65,
+        'master lookups': 70, 'Merging': 75,
+        'Updating Cadence': 80, 'Calculating due': 85,
+        'Finalizing': 90, 'ready': 100,
+    }.items()
+]
+
+# xlsxwriter workbook options - cell text is written as-is, like openpyxl did
+XLSX_OPTIONS = {'strings_to_urls': False}
+
+# Rows sent to the browser per page of the Data View table
+PAGE_SIZE = 500
 
 # ============== Custom CSS ==============
 st.markdown("""
@@ -64,6 +78,12 @@ st.markdown("""
         margin-bottom: 10px;
     }
 
+    .metric-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+
     .metric-value {
         font-size: 2.5rem;
         font-weight: bold;
@@ -87,7 +107,11 @@ st.markdown("""
     .node-ias { background-color: #28a745; }
     .node-gdn { background-color: #dc3545; }
 
-    .stButton>button {
+    .metric-container.node-blr { background: #667eea; }
+    .metric-container.node-ias { background: #28a745; }
+    .metric-container.node-gdn { background: #dc3545; }
+
+    .stButton>button, .stFormSubmitButton>button {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         border: none;
@@ -133,70 +157,75 @@ if 'selected_node' not in st.session_state:
 
 
 # ============== Helper Functions ==============
+@st.cache_data(show_spinner=False, max_entries=8)
 def create_download_buffer(df, filename):
-    """Create a download buffer for Excel file"""
+    """Create the Excel file bytes for a download - cached so reruns skip the Excel write"""
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    with pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': XLSX_OPTIONS}) as writer:
         df.to_excel(writer, index=False, sheet_name='Sheet1')
-    output.seek(0)
-    return output
+    return output.getvalue()
 
 
-def display_metrics(cadence_df, node_name):
-    """Display key metrics in cards"""
-    node_color = NODE_COLORS.get(node_name, '#667eea')
-
-    col1, col2, col3, col4 = st.columns(4)
+@st.cache_data(show_spinner=False, max_entries=2)
+def build_all_reports(cadence_df, master_df, armt_df):
+    """Create the single-file workbook with the Cadence, Master and ARMT sheets.
+    Rows are streamed in constant_memory mode, so only the current row is held by xlsxwriter"""
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {
+        **XLSX_OPTIONS, 'constant_memory': True, 'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    })
+    # Same header style as DataFrame.to_excel
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
 
-    with col1:
-        st.markdown(f"""
-        <div class="metric-container" style="background: {node_color};">
-            <div class="metric-value">{len(cadence_df):,}</div>
-            <div class="metric-label">Total Records</div>
-        </div>
-        """, unsafe_allow_html=True)
+    for sheet_name, df in [('Cadence', cadence_df), ('Master', master_df), ('ARMT', armt_df)]:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, df.columns, header_format)
+        # constant_memory needs row-by-row writes (to_excel writes column by column).
+        # Missing values are blanked per row so no more than one row is converted at a time
+        for row, record in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row, 0, [None if pd.isna(value) else value for value in record])
 
-    with col2:
-        classes_current = len(cadence_df[cadence_df['NC Count'] != 'not Found!'])
-        st.markdown(f"""
-        <div class="metric-container" style="background: {node_color};">
-            <div class="metric-value">{classes_current:,}</div>
-            <div class="metric-label">Classes in Current Month</div>
-        </div>
-        """, unsafe_allow_html=True)
+    workbook.close()
+    return output.getvalue()
 
-    with col3:
-        nc_found = len(cadence_df[cadence_df['NC Count'] != 'not Found!'])
-        st.markdown(f"""
-        <div class="metric-container" style="background: {node_color};">
-            <div class="metric-value">{nc_found:,}</div>
-            <div class="metric-label">Records with NC</div>
-        </div>
-        """, unsafe_allow_html=True)
 
-    with col4:
-        jsr_yes = len(cadence_df[cadence_df['JSR'] == 'Yes']) if 'JSR' in cadence_df.columns else 0
-        st.markdown(f"""
-        <div class="metric-container" style="background: {node_color};">
-            <div class="metric-value">{jsr_yes:,}</div>
-            <div class="metric-label">JSR Policies</div>
-        </div>
-        """, unsafe_allow_html=True)
+def display_metrics(cadence_df, node_name):
+    """Display key metrics in cards"""
+    # One pass over NC Count serves both NC cards
+    nc_found = int((cadence_df['NC Count'].to_numpy() != 'not Found!').sum())
+    jsr_yes = int((cadence_df['JSR'].to_numpy() == 'Yes').sum()) if 'JSR' in cadence_df.columns else 0
+
+    cards = [
+        (len(cadence_df), 'Total Records'),
+        (nc_found, 'Classes in Current Month'),
+        (nc_found, 'Records with NC'),
+        (jsr_yes, 'JSR Policies'),
+    ]
+    # All four cards go out as one HTML block
+    cards_html = ''.join(f"""
+        <div class="metric-container node-{node_name.lower()}">
+            <div class="metric-value">{value:,}</div>
+            <div class="metric-label">{label}</div>
+        </div>""" for value, label in cards)
+    st.markdown(f'<div class="metric-row">{cards_html}</div>', unsafe_allow_html=True)
 
 
 def create_visualizations(cadence_df):
     """Create interactive visualizations"""
     col1, col2 = st.columns(2)
 
+    # Cadence Score and risk score come out of the processors as numbers - only missing values are dropped
     with col1:
         if 'Cadence Score' in cadence_df.columns:
-            score_df = cadence_df[cadence_df['Cadence Score'] != 'not Found!'].copy()
-            score_df['Cadence Score'] = pd.to_numeric(score_df['Cadence Score'], errors='coerce')
-            score_df = score_df.dropna(subset=['Cadence Score'])
+            score_df = cadence_df['Cadence Score'].dropna()
 
             if len(score_df) > 0:
-                score_counts = score_df['Cadence Score'].value_counts().reset_index()
+                score_counts = score_df.value_counts().reset_index()
                 score_counts.columns = ['Cadence Score', 'Count']
+                if len(score_counts) > 12:
+                    # Keep the pie readable - everything past the top 11 is rolled into one 'Other' slice
+                    other = pd.DataFrame([{'Cadence Score': 'Other', 'Count': score_counts['Count'].iloc[11:].sum()}])
+                    score_counts = pd.concat([score_counts.head(11), other], ignore_index=True)
 
                 fig = px.pie(
                     score_counts,
@@ -211,40 +240,36 @@ def create_visualizations(cadence_df):
 
     with col2:
         if 'risk score' in cadence_df.columns:
-            risk_df = cadence_df.copy()
-            risk_df['risk score'] = pd.to_numeric(risk_df['risk score'], errors='coerce')
-            risk_df = risk_df.dropna(subset=['risk score'])
+            risk_df = cadence_df['risk score'].dropna()
 
             if len(risk_df) > 0:
-                risk_counts = risk_df['risk score'].value_counts().sort_index().reset_index()
+                risk_counts = risk_df.value_counts().sort_index().reset_index()
                 risk_counts.columns = ['Risk Score', 'Count']
 
-                fig = px.bar(
-                    risk_counts,
-                    x='Risk Score',
-                    y='Count',
-                    title='📈 Risk Score Distribution',
-                    color='Count',
-                    color_continuous_scale='Purples'
-                )
+                fig = go.Figure(go.Bar(
+                    x=risk_counts['Risk Score'],
+                    y=risk_counts['Count'],
+                    marker=dict(color=risk_counts['Count'], colorscale='Purples', colorbar=dict(title='Count'))
+                ))
+                fig.update_layout(title='📈 Risk Score Distribution', xaxis_title='Risk Score', yaxis_title='Count')
                 st.plotly_chart(fig, use_container_width=True)
 
     if 'Source' in cadence_df.columns:
         source_df = cadence_df[cadence_df['Source'] != 'not Found!'].copy()
 
         if len(source_df) > 0:
-            source_counts = source_df['Source'].value_counts().head(10).reset_index()
+            source_counts = source_df['Source'].value_counts()
+            # Categorical counts also list the unused categories with 0
+            source_counts = source_counts[source_counts > 0].head(10).reset_index()
             source_counts.columns = ['Source', 'Count']
 
-            fig = px.bar(
-                source_counts,
-                y='Source',
-                x='Count',
-                title='🌍 Top 10 Sources',
+            fig = go.Figure(go.Bar(
+                x=source_counts['Count'],
+                y=source_counts['Source'],
                 orientation='h',
-                color='Count',
-                color_continuous_scale='Viridis'
-            )
+                marker=dict(color=source_counts['Count'], colorscale='Viridis', colorbar=dict(title='Count'))
+            ))
+            fig.update_layout(title='🌍 Top 10 Sources', xaxis_title='Count', yaxis_title='Source')
             st.plotly_chart(fig, use_container_width=True)
 
 
@@ -263,13 +288,21 @@ def process_with_status(processor_class, files_dict, output_month):
     status_container = st.status("🚀 Processing Cadence...", expanded=True)
     current_status = st.empty()
     log_expander = st.expander("📋 Detailed Processing Logs", expanded=True)
-    log_placeholder = log_expander.empty()
+    # Finished lines are appended once - only the current line is re-rendered per message
+    log_box = log_expander.container(height=400)
+    completed_logs = log_box.container()
+    current_log = log_box.empty()
     progress_bar = st.progress(0)
 
+    log_line = ('<div style="background: #1e1e1e; color: {color}; padding: 5px 15px; '
+                'font-family: \'Courier New\', monospace;">{marker} {message}</div>')
     live_logs = []
 
     def update_status(message):
         """Callback function to update UI"""
+        if live_logs:
+            completed_logs.markdown(log_line.format(color='#00ff00', marker='✓', message=live_logs[-1]),
+                                    unsafe_allow_html=True)
         live_logs.append(message)
 
         current_status.markdown(f"""
@@ -280,31 +313,11 @@ def process_with_status(processor_class, files_dict, output_month):
         </div>
         """, unsafe_allow_html=True)
 
-        log_html = ""
-        for i, log in enumerate(live_logs):
-            if i == len(live_logs) - 1:
-                log_html += f'<div style="color: #ffcc00; padding: 5px 0;">▶ {log}</div>'
-            else:
-                log_html += f'<div style="color: #00ff00; padding: 5px 0;">✓ {log}</div>'
-
-        log_placeholder.markdown(f"""
-        <div style="background: #1e1e1e; padding: 15px; border-radius: 10px; 
-                    font-family: 'Courier New', monospace; max-height: 400px; overflow-y: auto;">
-            {log_html}
-        </div>
-        """, unsafe_allow_html=True)
+        current_log.markdown(log_line.format(color='#ffcc00', marker='▶', message=message), unsafe_allow_html=True)
 
-        progress_mapping = {
-            'Starting': 5, 'Reading': 10, 'ARMT processed': 25,
-            'Outflow processed': 40, 'node mappings': 50,
-            'Creating Cadence': 55, 'Cadence created': 65,
-            'master lookups': 70, 'Merging': 75,
-            'Updating Cadence': 80, 'Calculating due': 85,
-            'Finalizing': 90, 'ready': 100,
-        }
-
-        for key, progress in progress_mapping.items():
-            if key.lower() in message.lower():
+        message_lower = message.lower()
+        for key, progress in PROGRESS_STEPS:
+            if key in message_lower:
                 progress_bar.progress(progress)
                 break
 
@@ -355,11 +368,10 @@ def main():
         )
         st.session_state.selected_node = selected_node
 
-        # Get processor and its config
+        # Get processor and its config - static per class, so no instance is needed
         processor_class = PROCESSORS[selected_node]
-        temp_processor = processor_class()
-        node_config = temp_processor.get_node_config()
-        required_files = temp_processor.get_required_files()
+        node_config = processor_class.get_node_config()
+        required_files = processor_class.get_required_files()
 
         # Display node info
         st.markdown(f"""
@@ -392,25 +404,27 @@ def main():
 
         st.markdown("---")
 
-        # Output month selection
-        st.markdown("#### 📅 Output Month")
-        current_month_idx = datetime.now().month - 1
-        output_month = st.selectbox(
-            "Select Month",
-            MONTHS,
-            index=current_month_idx,
-            label_visibility="collapsed"
-        )
+        # Month and button form one batch - picking a month doesn't rerun the app until submit
+        with st.form(key=f"process-{selected_node}", border=False):
+            # Output month selection
+            st.markdown("#### 📅 Output Month")
+            current_month_idx = datetime.now().month - 1
+            output_month = st.selectbox(
+                "Select Month",
+                MONTHS,
+                index=current_month_idx,
+                label_visibility="collapsed"
+            )
 
-        st.markdown("---")
+            st.markdown("---")
 
-        # Process button
-        process_clicked = st.button(
-            f"🚀 Process {selected_node} Cadence",
-            type="primary",
-            disabled=not all_files_uploaded,
-            use_container_width=True
-        )
+            # Process button
+            process_clicked = st.form_submit_button(
+                f"🚀 Process {selected_node} Cadence",
+                type="primary",
+                disabled=not all_files_uploaded,
+                use_container_width=True
+            )
 
         if not all_files_uploaded:
             st.warning("⚠️ Please upload all files")
@@ -435,6 +449,9 @@ def main():
         result = process_with_status(processor_class, uploaded_files, output_month)
 
         if result['success']:
+            # Categories hold the sorted filter options, so reruns don't rescan these columns
+            for col in ['Source', 'Cadence Score', 'program']:
+                result['cadence'][col] = result['cadence'][col].astype('category')
             st.session_state.processed_data = result
             st.session_state.processing_logs = result['logs']
             st.balloons()
@@ -465,15 +482,15 @@ def main():
             st.markdown("### 📋 Cadence Data")
 
             col1, col2, col3, col4 = st.columns(4)
-            cadence_df = data['cadence'].copy()
+            cadence_df = data['cadence']
 
             with col1:
-                sources = ['All'] + sorted([s for s in cadence_df['Source'].unique() if s != 'not Found!'])
+                sources = ['All'] + [s for s in cadence_df['Source'].cat.categories if s != 'not Found!']
                 selected_source = st.selectbox("Filter by Source", sources)
 
             with col2:
                 scores = ['All'] + sorted(
-                    [str(s) for s in cadence_df['Cadence Score'].unique() if str(s) != 'not Found!'])
+                    [str(s) for s in cadence_df['Cadence Score'].cat.categories if str(s) != 'not Found!'])
                 selected_score = st.selectbox("Filter by Cadence Score", scores)
 
             with col3:
@@ -481,21 +498,30 @@ def main():
                 selected_jsr = st.selectbox("Filter by JSR", jsr_options)
 
             with col4:
-                programs = ['All'] + sorted([p for p in cadence_df['program'].unique() if p != 'not Found!'])
+                programs = ['All'] + [p for p in cadence_df['program'].cat.categories if p != 'not Found!']
                 selected_program = st.selectbox("Filter by Program", programs)
 
-            filtered_df = cadence_df.copy()
+            # Combine the active filters into one mask and slice once
+            mask = np.ones(len(cadence_df), dtype=bool)
             if selected_source != 'All':
-                filtered_df = filtered_df[filtered_df['Source'] == selected_source]
+                mask &= (cadence_df['Source'] == selected_source).to_numpy()
             if selected_score != 'All':
-                filtered_df = filtered_df[filtered_df['Cadence Score'].astype(str) == selected_score]
+                mask &= (cadence_df['Cadence Score'].astype(str) == selected_score).to_numpy()
             if selected_jsr != 'All':
-                filtered_df = filtered_df[filtered_df['JSR'] == selected_jsr]
+                mask &= (cadence_df['JSR'] == selected_jsr).to_numpy()
             if selected_program != 'All':
-                filtered_df = filtered_df[filtered_df['program'] == selected_program]
+                mask &= (cadence_df['program'] == selected_program).to_numpy()
+            filtered_df = cadence_df[mask]
 
             st.markdown(f"**Showing {len(filtered_df):,} of {len(cadence_df):,} records**")
-            st.dataframe(filtered_df, use_container_width=True, height=500)
+
+            # Paginate server-side so only the current page is shipped to the browser
+            page_count = max(1, -(-len(filtered_df) // PAGE_SIZE))
+            page = 1
+            if page_count > 1:
+                page = st.number_input(f"Page (1-{page_count})", min_value=1, max_value=page_count, value=1, step=1)
+            start = (page - 1) * PAGE_SIZE
+            st.dataframe(filtered_df.iloc[start:start + PAGE_SIZE], use_container_width=True, height=500)
 
         with tab2:
             st.markdown("### 📊 Data Visualizations")
@@ -542,12 +568,7 @@ def main():
             st.markdown("---")
             st.markdown("#### 📦 Download All Data")
 
-            all_data_buffer = io.BytesIO()
-            with pd.ExcelWriter(all_data_buffer, engine='openpyxl') as writer:
-                data['cadence'].to_excel(writer, sheet_name='Cadence', index=False)
-                data['master'].to_excel(writer, sheet_name='Master', index=False)
-                data['armt'].to_excel(writer, sheet_name='ARMT', index=False)
-            all_data_buffer.seek(0)
+            all_data_buffer = build_all_reports(data['cadence'], data['master'], data['armt'])
 
             st.download_button(
                 label="⬇️ Download All Reports (Single File)",
@@ -0,0 +1,36 @@
+"""
+Tests for the shared BaseProcessor helpers
+"""
+
+import numpy as np
+import pandas as pd
+
+from Processors import GDNProcessor
+
+
+def test_dates_to_strings_keeps_strings_in_mixed_column():
+    """Strings mixed with Timestamps are kept as-is, like date_to_string does"""
+    processor = GDNProcessor()
+    dates = pd.Series([
+        pd.Timestamp('2024-01-02 10:30'), 'garbage', '05/06/2024', '2024-03-01',
+        None, np.nan, pd.NaT, 'not Found!'
+    ], dtype=object)
+
+    result = processor.dates_to_strings(dates)
+
+    assert result.tolist() == [
+        '2024-01-02', 'garbage', '05/06/2024', '2024-03-01',
+        'not Found!', 'not Found!', 'not Found!', 'not Found!'
+    ]
+    assert result.tolist() == [processor.date_to_string(value) for value in dates]
+
+
+def test_scores_to_strings_keeps_text_for_non_finite_or_huge_scores():
+    """'inf' and scores outside int64 keep their text instead of aborting the run"""
+    processor = GDNProcessor()
+
+    assert processor.scores_to_strings(pd.Series(['inf', 30])).tolist() == ['inf', '30']
+    assert processor.scores_to_strings(pd.Series([1e20])).tolist() == ['1e+20']
+    assert processor.scores_to_strings(pd.Series([60.7, None, 'not Found!'], dtype=object)).tolist() == [
+        '60', 'not Found!', 'not Found!'
+    ]
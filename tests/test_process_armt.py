@@ -0,0 +1,68 @@
+"""
+Tests for the IAS/BLR ARMT row expansion
+"""
+
+import pandas as pd
+import pytest
+
+from Processors import BLRProcessor, IASProcessor
+
+
+def armt_frame(index=None):
+    """One multi-country AmazonGlobal row, one CrossListing row and one single-country AmazonGlobal row"""
+    return pd.DataFrame({
+        'parent_class': ['P1', 'P2', 'P3'],
+        'child_class': ['C1', 'C2', 'C3'],
+        'program': ['AmazonGlobal', 'CrossListing', 'AmazonGlobal'],
+        'source_country': ['FR, IT', 'FR,ES', 'ES'],
+        'include_destination_country': ['US,GB', 'US, DE', 'DE'],
+    }, index=index)
+
+
+def expected_rows(armt):
+    """Reference expansion from the original frame-level explode steps"""
+    armt = armt.copy()
+    armt['Source'] = armt['source_country'].astype(str).str.strip()
+    armt['Destination'] = armt['include_destination_country'].astype(str).str.strip()
+
+    armt_core = armt[armt['program'] == 'AmazonGlobal'].copy()
+    armt_core['Source'] = armt_core['Source'].str.split(',')
+    armt_core = armt_core.explode('Source')
+    armt_core['Source'] = armt_core['Source'].str.strip()
+    armt_core.loc[armt_core['Destination'].str.contains(','), 'Destination'] = 'SOME'
+
+    armt_cross = armt[armt['program'] == 'CrossListing'].copy()
+    armt_cross['Destination'] = armt_cross['Destination'].str.split(',')
+    armt_cross = armt_cross.explode('Destination')
+    armt_cross['Source'] = armt_cross['Source'].str.split(',')
+    armt_cross = armt_cross.explode('Source')
+    armt_cross['Source'] = armt_cross['Source'].str.strip()
+    armt_cross['Destination'] = armt_cross['Destination'].str.strip()
+
+    armt = pd.concat([armt_core, armt_cross], ignore_index=True)
+    return sorted(zip(armt['parent_class'], armt['Source'], armt['Destination']))
+
+
+@pytest.mark.parametrize('processor_class', [BLRProcessor, IASProcessor])
+@pytest.mark.parametrize('index', [None, [0, 1, 0]], ids=['unique-index', 'duplicate-index'])
+def test_process_armt_expands_source_destination_pairs(processor_class, index):
+    """Comma lists become one row per Source (AmazonGlobal) or per Source/Destination pair (CrossListing)"""
+    armt = armt_frame(index)
+
+    result = processor_class().process_armt(armt.copy())
+
+    rows = sorted(zip(result['parent_class'], result['Source'], result['Destination']))
+    assert rows == expected_rows(armt)
+    assert rows == [
+        ('P1', 'FR', 'SOME'), ('P1', 'IT', 'SOME'),
+        ('P2', 'ES', 'DE'), ('P2', 'ES', 'US'), ('P2', 'FR', 'DE'), ('P2', 'FR', 'US'),
+        ('P3', 'ES', 'DE'),
+    ]
+    assert sorted(result['ARC']) == ['ES-DE', 'ES-DE', 'ES-US', 'FR-DE', 'FR-SOME', 'FR-US', 'IT-SOME']
+    assert sorted(result['combined_class']) == [
+        'P1,C1,FR', 'P1,C1,IT', 'P2,C2,ES', 'P2,C2,ES', 'P2,C2,FR', 'P2,C2,FR', 'P3,C3,ES'
+    ]
+    assert sorted(result['combined_class2']) == [
+        'P1,C1,FR-SOME', 'P1,C1,IT-SOME', 'P2,C2,ES-DE', 'P2,C2,ES-US',
+        'P2,C2,FR-DE', 'P2,C2,FR-US', 'P3,C3,ES-DE'
+    ]
@@ -0,0 +1,100 @@
+"""
+Tests for the update_cadence_score business rules of every node
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Processors import BLRProcessor, IASProcessor, GDNProcessor
+
+NOT_FOUND = 'not Found!'
+
+
+def chained_where_scores(Cadence):
+    """Reference scores from the original chained np.where rules (later rules win)"""
+    nc = pd.to_numeric(Cadence['NC Count'], errors='coerce')
+    prev_nc = pd.to_numeric(Cadence['Previous NC'], errors='coerce')
+    prev_cad = pd.to_numeric(Cadence['Previous Cadence'], errors='coerce')
+    risk = Cadence['risk score'].astype(float)
+
+    has_nc = nc.notna()
+    has_prev_nc = prev_nc.notna()
+    low_risk = risk.isin([1, 2, 3])
+    high_risk = risk.isin([4, 5])
+
+    rules = []
+    for cadence, high, low_next, high_prev in [(30, 30, 60, 30), (60, 30, 90, 60)]:
+        mask = prev_cad == cadence
+        rules += [
+            (mask & has_nc & (nc >= 10), high),
+            (mask & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), high_prev),
+            (mask & (~has_nc) & has_prev_nc & (prev_nc >= 10), high_prev),
+            (mask & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10), low_next),
+            (mask & has_nc & (nc < 10) & (~has_prev_nc), low_next),
+        ]
+    mask = prev_cad == 90
+    rules += [
+        (mask & has_nc & (nc >= 10), 60),
+        (mask & has_nc & (nc < 10) & has_prev_nc & (prev_nc >= 10), 90),
+        (mask & (~has_nc) & has_prev_nc & (prev_nc >= 10), 90),
+        (mask & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & low_risk, 90),
+        (mask & has_nc & (nc < 10) & has_prev_nc & (prev_nc < 10) & high_risk, 180),
+        (mask & has_nc & (nc < 10) & (~has_prev_nc) & low_risk, 90),
+        (mask & has_nc & (nc < 10) & (~has_prev_nc) & high_risk, 180),
+    ]
+    mask = prev_cad == 180
+    rules += [
+        (mask & has_nc & (nc >= 15), 90),
+        (mask & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 180),
+        (mask & (~has_nc) & has_prev_nc & (prev_nc >= 15), 180),
+        (mask & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk == 4), 180),
+        (mask & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15) & (risk != 4), 365),
+        (mask & has_nc & (nc < 15) & (~has_prev_nc) & (risk == 4), 180),
+        (mask & has_nc & (nc < 15) & (~has_prev_nc) & (risk != 4), 365),
+    ]
+    mask = prev_cad == 365
+    rules += [
+        (mask & has_nc & (nc >= 15), 180),
+        (mask & has_nc & (nc < 15) & has_prev_nc & (prev_nc >= 15), 365),
+        (mask & (~has_nc) & has_prev_nc & (prev_nc >= 15), 365),
+        (mask & has_nc & (nc < 15) & has_prev_nc & (prev_nc < 15), 365),
+        (mask & has_nc & (nc < 15) & (~has_prev_nc), 365),
+    ]
+
+    new_score = Cadence['Cadence Score'].astype(float)
+    for condition, score in rules:
+        new_score = np.where(condition, score, new_score)
+    return new_score.astype(int)
+
+
+def rule_grid():
+    """Every previous cadence / NC / previous NC / risk combination around the 10 and 15 thresholds"""
+    rows = itertools.product(
+        ['30', '60', '90', '180', '365', '45', NOT_FOUND],
+        [NOT_FOUND, '5.0', '9.0', '10.0', '12.0', '14.0', '15.0', '20.0'],
+        [NOT_FOUND, '5', '9', '10', '14', '15', '20'],
+        [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+    )
+    Cadence = pd.DataFrame(rows, columns=['Previous Cadence', 'NC Count', 'Previous NC', 'risk score'])
+    # Sentinel initial score - rows that match no rule keep it
+    Cadence['Cadence Score'] = 7
+    # Parsed helper columns the IAS/BLR pipeline builds in create_cadence / apply_master_lookups
+    Cadence['_NC_num'] = pd.to_numeric(Cadence['NC Count'], errors='coerce')
+    Cadence['_prev_cadence_num'] = pd.to_numeric(Cadence['Previous Cadence'], errors='coerce')
+    return Cadence
+
+
+@pytest.mark.parametrize('processor_class', [BLRProcessor, IASProcessor, GDNProcessor])
+def test_update_cadence_score_matches_chained_rules(processor_class):
+    """The np.select rule table gives the same scores as the chained np.where rules"""
+    Cadence = rule_grid()
+    expected = chained_where_scores(Cadence)
+
+    result = processor_class().update_cadence_score(Cadence.copy())
+
+    np.testing.assert_array_equal(result['Cadence Score'].to_numpy(), expected)
+    # Every output score and the no-rule fallback are exercised
+    assert set(expected) == {7, 30, 60, 90, 180, 365}